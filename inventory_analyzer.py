@@ -25,15 +25,44 @@ import matplotlib.ticker as mticker
 from matplotlib.backends.backend_pdf import PdfPages
 from matplotlib.gridspec import GridSpec
 import matplotlib.patches as mpatches
+from matplotlib.lines import Line2D
+from matplotlib.font_manager import FontProperties
+import functools
+import io
+import os
+import multiprocessing as mp
 import warnings
+from typing import TYPE_CHECKING
 warnings.filterwarnings("ignore")
 
+if TYPE_CHECKING:
+    import polars as pl
+
+try:  # optional: Parquet export
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 # ─────────────────────────────────────────────
 # CONFIG
 # ─────────────────────────────────────────────
 BRANCHES = ["Johannesburg", "Cape Town", "Durban", "Pretoria", "Bloemfontein", "Port Elizabeth"]
 MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
 
+# Run add_calculated_columns and the groupby aggregates on Polars (only takes
+# effect when polars is installed; pandas is used otherwise). polars is
+# imported on first use, not at module load
+USE_POLARS = True
+
+# Below this many SKU-branch rows the NumPy sales synthesis is used even when
+# numba is installed (JIT compile time would dominate); numba is only
+# imported once this size is reached
+NUMBA_MIN_ROWS = 100_000
+
+# Avg monthly sales thresholds: < 8 Slow-Moving, 8–29 Stable, >= 30 High Demand
+DEMAND_BINS = [8, 30]
+DEMAND_CLASSES = ["Slow-Moving", "Stable", "High Demand"]
+
 COLORS = {
     "High Demand": "#10b981",
     "Stable":      "#3b82f6",
@@ -62,15 +91,57 @@ plt.rcParams.update({
     "legend.facecolor": BG_CARD,
     "legend.edgecolor": BG_GRID,
     "legend.fontsize":  8,
+    "text.usetex":      False,
 })
 
+# Shared font properties for report text (per-call fontsize/fontweight override them)
+REPORT_FONT = FontProperties(family="DejaVu Sans", size=10)
+REPORT_FONT_MONO = FontProperties(family="monospace", size=10)
+
 
 # ═══════════════════════════════════════════════════════════════
 # 1. GENERATE MOCK DATASET
 # ═══════════════════════════════════════════════════════════════
 
-def generate_dataset() -> pd.DataFrame:
-    """Generate a realistic mock dataset of 40 automotive SKUs across 6 branches."""
+@functools.cache
+def _synth_monthly_numba():
+    """JIT-compiled sales synthesis kernel, or None when numba is not installed."""
+    try:
+        from numba import njit, prange
+    except ImportError:
+        return None
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def kernel(avg, seasonal, noise):
+        out = np.empty(noise.shape, np.int64)
+        for i in prange(avg.shape[0]):
+            for j in range(avg.shape[1]):
+                for m in range(noise.shape[2]):
+                    v = avg[i, j] * seasonal[m] * noise[i, j, m]
+                    out[i, j, m] = 0 if v < 0 else int(v)
+        return out
+
+    return kernel
+
+
+def _synth_monthly(avg: np.ndarray, seasonal: np.ndarray, noise: np.ndarray) -> np.ndarray:
+    """Monthly unit sales = avg × seasonal × noise, truncated and floored at 0.
+
+    avg is (parts, branches), seasonal (12,), noise (parts, branches, 12).
+    """
+    if avg.size >= NUMBA_MIN_ROWS:
+        kernel = _synth_monthly_numba()
+        if kernel is not None:
+            return kernel(avg, seasonal, noise)
+    return np.maximum(0, (avg[..., None] * seasonal * noise).astype(int))
+
+
+def generate_dataset() -> tuple[pd.DataFrame, np.ndarray]:
+    """Generate a realistic mock dataset of 40 automotive SKUs across 6 branches.
+
+    Returns the per-row DataFrame and a row-aligned (rows, 12) matrix of
+    monthly unit sales (Jan–Dec).
+    """
 
     parts = [
         ("SP-1001", "Spark Plug – Iridium",      "Engine",       89.99),
@@ -116,104 +187,136 @@ def generate_dataset() -> pd.DataFrame:
     ]
 
     rng = np.random.default_rng(42)
-    rows = []
-
-    for pi, (sku, name, category, cost) in enumerate(parts):
-        for bi, branch in enumerate(BRANCHES):
-            # Deterministic demand profile
-            seed_val = (pi * 7 + bi * 13) % 10
-            if seed_val < 3:
-                profile = "high"
-                avg_monthly = int(rng.integers(40, 120))
-            elif seed_val < 7:
-                profile = "stable"
-                avg_monthly = int(rng.integers(10, 30))
-            else:
-                profile = "low"
-                avg_monthly = int(rng.integers(0, 8))
-
-            # 12-month sales with seasonality + noise
-            monthly_sales = []
-            for m in range(12):
-                seasonal = 1 + 0.2 * np.sin((m / 12) * np.pi * 2)
-                noise = 0.7 + rng.random() * 0.6
-                monthly_sales.append(max(0, int(avg_monthly * seasonal * noise)))
-
-            total_12m = sum(monthly_sales)
-            current_stock = int(rng.integers(2, avg_monthly * 4 + 5))
-            lead_time_days = int(rng.integers(7, 28))
-
-            rows.append({
-                "sku": sku,
-                "part_name": name,
-                "category": category,
-                "branch": branch,
-                "unit_cost_zar": cost,
-                "avg_monthly_sales": avg_monthly,
-                "total_sold_12m": total_12m,
-                "current_stock": current_stock,
-                "lead_time_days": lead_time_days,
-                "safety_stock_days": 7,
-                **{f"sales_{MONTHS[m].lower()}": monthly_sales[m] for m in range(12)},
-            })
-
-    df = pd.DataFrame(rows)
-    return df
+    n_parts, n_branches = len(parts), len(BRANCHES)
+    skus, names, categories, costs = (np.array(col) for col in zip(*parts))
+
+    # Deterministic demand profile: high / stable / low
+    seed_val = (np.arange(n_parts)[:, None] * 7 + np.arange(n_branches)[None, :] * 13) % 10
+    is_high, is_stable = seed_val < 3, (seed_val >= 3) & (seed_val < 7)
+    low = np.where(is_high, 40, np.where(is_stable, 10, 0))
+    high = np.where(is_high, 120, np.where(is_stable, 30, 8))
+    avg_monthly = rng.integers(low, high, size=(n_parts, n_branches))
+
+    # 12-month sales with seasonality + noise, shape (parts, branches, 12)
+    seasonal = 1 + 0.2 * np.sin(np.arange(12) * 2 * np.pi / 12)
+    noise = 0.7 + rng.random((n_parts, n_branches, 12)) * 0.6
+    monthly = _synth_monthly(avg_monthly, seasonal, noise)
+    total_12m = monthly.sum(axis=-1)
+
+    current_stock = rng.integers(2, avg_monthly * 4 + 5)
+    lead_time_days = rng.integers(7, 28, size=(n_parts, n_branches))
+
+    # Row layout is part-major: row = part_index * n_branches + branch_index.
+    # Repeated labels go straight in as categorical codes (cheaper groupby /
+    # filter / memory), every other column as a typed ndarray.
+    n_rows = n_parts * n_branches
+    part_idx = np.repeat(np.arange(n_parts), n_branches)
+    branch_idx = np.tile(np.arange(n_branches), n_parts)
+    df = pd.DataFrame({
+        "sku": pd.Categorical(skus[part_idx]),
+        "part_name": pd.Categorical(names[part_idx]),
+        "category": pd.Categorical(categories[part_idx]),
+        "branch": pd.Categorical(np.array(BRANCHES)[branch_idx]),
+        "unit_cost_zar": costs[part_idx],
+        "avg_monthly_sales": avg_monthly.ravel(),
+        "total_sold_12m": total_12m.ravel(),
+        "current_stock": current_stock.ravel(),
+        "lead_time_days": lead_time_days.ravel(),
+        "safety_stock_days": np.full(n_rows, 7, dtype=np.int64),
+    })
+
+    # Sort once by the groupby keys (monthly rows follow) so every later
+    # groupby sees contiguous branch / category runs
+    df = df.sort_values(["branch", "category"], kind="stable")
+    monthly = monthly.reshape(n_rows, 12)[df.index.to_numpy()]
+    return df.reset_index(drop=True), monthly
 
 
 # ═══════════════════════════════════════════════════════════════
 # 2. CLASSIFICATION & CALCULATIONS
 # ═══════════════════════════════════════════════════════════════
 
-def classify_demand(avg_monthly: int) -> str:
-    """Classify part demand based on average monthly sales."""
-    if avg_monthly >= 30:
-        return "High Demand"
-    elif avg_monthly >= 8:
-        return "Stable"
-    else:
-        return "Slow-Moving"
+def _use_polars() -> bool:
+    if not USE_POLARS:
+        return False
+    try:
+        import polars  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def _polars_frame(df: pd.DataFrame, columns: list[str]) -> "pl.DataFrame":
+    """Polars frame over the given columns; categoricals are passed as their integer codes."""
+    import polars as pl
+    return pl.DataFrame({
+        c: (df[c].cat.codes if isinstance(df[c].dtype, pd.CategoricalDtype) else df[c]).to_numpy()
+        for c in columns
+    })
+
+
+def _polars_to_pandas(stats: "pl.DataFrame", key: pd.Series) -> pd.DataFrame:
+    """Convert a Polars aggregate keyed by category codes back to a label-indexed pandas frame."""
+    codes = stats[key.name].to_numpy()
+    return pd.DataFrame(
+        {c: stats[c].to_numpy() for c in stats.columns if c != key.name},
+        index=pd.CategoricalIndex(pd.Categorical.from_codes(codes, dtype=key.dtype), name=key.name),
+    )
 
 
 def add_calculated_columns(df: pd.DataFrame) -> pd.DataFrame:
-    """Add all derived analytics columns."""
-    df = df.copy()
+    """Add all derived analytics columns (in place; the same frame is returned)."""
+    if _use_polars():
+        return _add_calculated_columns_polars(df)
+
+    avg = df["avg_monthly_sales"].to_numpy()
+    cur_stock = df["current_stock"].to_numpy()
+    ss_days = df["safety_stock_days"].to_numpy()
+    lt_days = df["lead_time_days"].to_numpy()
 
     # Demand classification
-    df["demand_class"] = df["avg_monthly_sales"].apply(classify_demand)
+    df["demand_class"] = pd.Categorical.from_codes(
+        np.searchsorted(DEMAND_BINS, avg, side="right"),
+        categories=DEMAND_CLASSES,
+    )
+    df["is_slow"] = df["demand_class"] == "Slow-Moving"
 
     # Daily sales rate
-    df["daily_sales_rate"] = df["avg_monthly_sales"] / 30
-
-    # Safety stock (units)
-    df["safety_stock_units"] = np.ceil(df["daily_sales_rate"] * df["safety_stock_days"]).astype(int)
+    df["daily_sales_rate"] = avg / 30.0
 
-    # Lead time demand
-    df["lead_time_demand"] = np.ceil(df["daily_sales_rate"] * df["lead_time_days"]).astype(int)
+    # Safety stock and lead time demand (units), ceil(avg × days / 30) kept
+    # in integer arithmetic via -(-a // b)
+    safety_units = -(-avg * ss_days // 30)
+    lt_demand = -(-avg * lt_days // 30)
+    df["safety_stock_units"] = safety_units
+    df["lead_time_demand"] = lt_demand
 
     # ──────────────────────────────────────────
     # REORDER POINT FORMULA:
     #   ROP = (Daily Sales Rate × Lead Time) + Safety Stock
     # ──────────────────────────────────────────
-    df["reorder_point"] = df["lead_time_demand"] + df["safety_stock_units"]
+    rop = lt_demand + safety_units
+    df["reorder_point"] = rop
 
-    # Days of stock remaining
+    # Days of stock remaining, stock × 30 / avg from the integer columns so
+    # both engines round the same exactly-divided value
     df["days_of_stock"] = np.where(
-        df["daily_sales_rate"] > 0,
-        np.round(df["current_stock"] / df["daily_sales_rate"]),
+        avg > 0,
+        np.round(cur_stock * 30 / avg),
         9999
     ).astype(int)
 
-    # Reorder flag
-    df["needs_reorder"] = df["current_stock"] <= df["reorder_point"]
+    # Reorder flag, shortfall and suggested order quantity (cover 1 month +
+    # shortfall), all from a single ROP − stock difference
+    diff = rop - cur_stock
+    shortfall = np.maximum(0, diff)
+    df["needs_reorder"] = diff >= 0
+    df["shortfall"] = shortfall
+    df["suggested_order"] = np.maximum(shortfall, avg)
 
     # Stock value
     df["stock_value_zar"] = df["current_stock"] * df["unit_cost_zar"]
 
-    # Suggested order quantity (cover 1 month + shortfall)
-    df["shortfall"] = np.maximum(0, df["reorder_point"] - df["current_stock"])
-    df["suggested_order"] = np.maximum(df["shortfall"], df["avg_monthly_sales"])
-
     # Inventory turnover (12-month)
     df["turnover_ratio"] = np.where(
         df["stock_value_zar"] > 0,
@@ -224,18 +327,117 @@ def add_calculated_columns(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+def _add_calculated_columns_polars(df: pd.DataFrame) -> pd.DataFrame:
+    """Polars version of add_calculated_columns; results are written back onto df."""
+    import polars as pl
+    avg, stock = pl.col("avg_monthly_sales"), pl.col("current_stock")
+
+    out = _polars_frame(df, [
+        "avg_monthly_sales", "current_stock", "safety_stock_days",
+        "lead_time_days", "unit_cost_zar", "total_sold_12m",
+    ]).with_columns(
+        # Demand code = number of DEMAND_BINS thresholds reached (index into DEMAND_CLASSES)
+        pl.sum_horizontal([avg >= b for b in DEMAND_BINS]).alias("demand_code"),
+        (-(-avg * pl.col("safety_stock_days") // 30)).alias("safety_stock_units"),
+        (-(-avg * pl.col("lead_time_days") // 30)).alias("lead_time_demand"),
+        (stock * pl.col("unit_cost_zar")).alias("stock_value_zar"),
+    ).with_columns(
+        # REORDER POINT FORMULA: ROP = (Daily Sales Rate × Lead Time) + Safety Stock
+        (pl.col("lead_time_demand") + pl.col("safety_stock_units")).alias("reorder_point"),
+        pl.when(avg > 0).then((stock * 30 / avg).round(0)).otherwise(9999)
+          .cast(pl.Int64).alias("days_of_stock"),
+        pl.when(pl.col("stock_value_zar") > 0)
+          .then(pl.col("total_sold_12m") * pl.col("unit_cost_zar") / pl.col("stock_value_zar"))
+          .otherwise(0.0).round(1).alias("turnover_ratio"),
+    ).with_columns(
+        (pl.col("reorder_point") - stock).alias("diff"),
+    ).with_columns(
+        (pl.col("diff") >= 0).alias("needs_reorder"),
+        pl.max_horizontal(pl.col("diff"), 0).alias("shortfall"),
+    ).with_columns(
+        pl.max_horizontal(pl.col("shortfall"), avg).alias("suggested_order"),
+    )
+
+    df["demand_class"] = pd.Categorical.from_codes(out["demand_code"].to_numpy(),
+                                                   categories=DEMAND_CLASSES)
+    df["is_slow"] = df["demand_class"] == "Slow-Moving"
+    # Polars divides by a scalar via its reciprocal, which can be 1 ulp off
+    # the pandas result, so the rate is taken from NumPy
+    df["daily_sales_rate"] = df["avg_monthly_sales"].to_numpy() / 30.0
+    for col in ("safety_stock_units", "lead_time_demand", "reorder_point",
+                "days_of_stock", "needs_reorder", "shortfall", "suggested_order",
+                "stock_value_zar", "turnover_ratio"):
+        df[col] = out[col].to_numpy()
+    return df
+
+
 # ═══════════════════════════════════════════════════════════════
 # 3. ANALYSIS SUMMARIES
 # ═══════════════════════════════════════════════════════════════
 
-def print_kpi_summary(df: pd.DataFrame):
+def compute_branch_stats(df: pd.DataFrame) -> pd.DataFrame:
+    """Aggregate per-branch KPIs, sorted by 12-month sales (highest first).
+
+    Ties keep branch order, in both the pandas and the Polars path.
+    """
+    if _use_polars():
+        import polars as pl
+        stats = _polars_frame(df, [
+            "branch", "total_sold_12m", "stock_value_zar", "is_slow", "needs_reorder", "turnover_ratio",
+        ]).group_by("branch", maintain_order=True).agg(
+            pl.col("total_sold_12m").sum().alias("total_sales"),
+            pl.col("stock_value_zar").sum().alias("stock_value"),
+            pl.col("is_slow").sum().cast(pl.Int64).alias("slow_movers"),
+            pl.col("needs_reorder").sum().cast(pl.Int64).alias("reorder_alerts"),
+            pl.col("turnover_ratio").mean().alias("avg_turnover"),
+        ).sort("total_sales", descending=True, maintain_order=True)
+        return _polars_to_pandas(stats, df["branch"])
+
+    return df.groupby("branch", sort=False, observed=True).agg(
+        total_sales=("total_sold_12m", "sum"),
+        stock_value=("stock_value_zar", "sum"),
+        slow_movers=("is_slow", "sum"),
+        reorder_alerts=("needs_reorder", "sum"),
+        avg_turnover=("turnover_ratio", "mean"),
+    ).sort_values("total_sales", ascending=False, kind="stable")
+
+
+def compute_dead_stock_by_category(df: pd.DataFrame, slow_mask: np.ndarray) -> pd.DataFrame:
+    """Aggregate slow-moving stock per category, sorted by stock value at risk.
+
+    Ties keep category order, in both the pandas and the Polars path.
+    """
+    if _use_polars():
+        import polars as pl
+        days = pl.col("days_of_stock")
+        stats = _polars_frame(df, ["category", "stock_value_zar", "days_of_stock"]).filter(
+            pl.Series(slow_mask)
+        ).group_by("category", maintain_order=True).agg(
+            pl.len().cast(pl.Int64).alias("count"),
+            pl.col("stock_value_zar").sum().alias("total_value"),
+            # 9999 marks "no sales" — nulled so the mean skips it (NaN if a category has none)
+            pl.when(days < 9999).then(days).mean().alias("avg_days"),
+        ).sort("total_value", descending=True, maintain_order=True)
+        return _polars_to_pandas(stats, df["category"])
+
+    slow = df[slow_mask]
+    days = slow["days_of_stock"].to_numpy()
+    # 9999 marks "no sales" — excluded from the average (NaN if a category has none)
+    return slow.assign(finite_days=np.where(days < 9999, days, np.nan)).groupby("category", sort=False, observed=True).agg(
+        count=("sku", "count"),
+        total_value=("stock_value_zar", "sum"),
+        avg_days=("finite_days", "mean"),
+    ).sort_values("total_value", ascending=False, kind="stable")
+
+
+def print_kpi_summary(df: pd.DataFrame, slow_mask: np.ndarray, reorder_mask: np.ndarray):
     """Print high-level KPIs to console."""
     total_skus = len(df)
-    total_stock_value = df["stock_value_zar"].sum()
-    slow = df[df["demand_class"] == "Slow-Moving"]
-    slow_count = len(slow)
-    dead_stock_value = slow["stock_value_zar"].sum()
-    reorder_count = df["needs_reorder"].sum()
+    stock_value = df["stock_value_zar"].to_numpy()
+    total_stock_value = stock_value.sum()
+    slow_count = int(slow_mask.sum())
+    dead_stock_value = stock_value[slow_mask].sum()
+    reorder_count = reorder_mask.sum()
     avg_turnover = df["turnover_ratio"].mean()
 
     print("\n" + "═" * 70)
@@ -264,9 +466,9 @@ def print_demand_breakdown(df: pd.DataFrame):
     print("└──────────────┴──────────┴────────────┴──────────────┘")
 
 
-def print_reorder_alerts(df: pd.DataFrame, top_n: int = 20):
+def print_reorder_alerts(df: pd.DataFrame, reorder_mask: np.ndarray, top_n: int = 20):
     """Print items needing reorder, sorted by urgency."""
-    reorder_df = df[df["needs_reorder"]].sort_values("days_of_stock").head(top_n)
+    reorder_df = df[reorder_mask].sort_values("days_of_stock").head(top_n)
 
     print(f"\n⚠  TOP {top_n} REORDER ALERTS (sorted by days of stock remaining)")
     print("─" * 110)
@@ -274,54 +476,45 @@ def print_reorder_alerts(df: pd.DataFrame, top_n: int = 20):
           f"{'Lead':>5} {'Daily':>6} {'Safety':>6} {'Order':>7}")
     print("─" * 110)
 
-    for _, row in reorder_df.iterrows():
-        print(f"{row['sku']:<10} {row['part_name'][:27]:<28} {row['branch']:<14} "
-              f"{row['current_stock']:>6} {row['reorder_point']:>5} "
-              f"{'-' + str(row['shortfall']):>6} {str(row['lead_time_days']) + 'd':>5} "
-              f"{row['daily_sales_rate']:>5.1f}/d {row['safety_stock_units']:>6} "
-              f"{row['suggested_order']:>5} units")
+    rows = reorder_df[["sku", "part_name", "branch", "current_stock", "reorder_point", "shortfall",
+                       "lead_time_days", "daily_sales_rate", "safety_stock_units",
+                       "suggested_order"]].to_numpy()
+    for sku, name, branch, stock, rop, short, lead, daily, safety, order in rows:
+        print(f"{sku:<10} {name[:27]:<28} {branch:<14} "
+              f"{stock:>6} {rop:>5} "
+              f"{'-' + str(short):>6} {str(lead) + 'd':>5} "
+              f"{daily:>5.1f}/d {safety:>6} "
+              f"{order:>5} units")
     print("─" * 110)
 
 
-def print_branch_comparison(df: pd.DataFrame):
-    """Print branch-level comparison."""
-    branch_stats = df.groupby("branch").agg(
-        total_sales=("total_sold_12m", "sum"),
-        stock_value=("stock_value_zar", "sum"),
-        slow_movers=("demand_class", lambda x: (x == "Slow-Moving").sum()),
-        reorder_alerts=("needs_reorder", "sum"),
-        avg_turnover=("turnover_ratio", "mean"),
-    ).sort_values("total_sales", ascending=False)
-
+def print_branch_comparison(branch_stats: pd.DataFrame):
+    """Print branch-level comparison (see compute_branch_stats)."""
     print("\n┌────────────────────────────────────────────────────────────────────────┐")
     print("│  BRANCH PERFORMANCE COMPARISON                                         │")
     print("├────────────────┬───────────┬──────────────┬────────┬─────────┬──────────┤")
     print("│ Branch         │ 12M Sales │ Stock Value  │ Slow   │ Reorder │ Turnover │")
     print("├────────────────┼───────────┼──────────────┼────────┼─────────┼──────────┤")
-    for branch, row in branch_stats.iterrows():
-        print(f"│ {branch:<14} │ {int(row['total_sales']):>9,} │ R {row['stock_value']:>10,.0f} │ "
-              f"{int(row['slow_movers']):>5}  │ {int(row['reorder_alerts']):>6}  │ {row['avg_turnover']:>6.1f}x  │")
+    rows = zip(branch_stats.index, *(branch_stats[c].to_numpy() for c in (
+        "total_sales", "stock_value", "slow_movers", "reorder_alerts", "avg_turnover")))
+    for branch, sales, value, slow, reorder, turnover in rows:
+        print(f"│ {branch:<14} │ {int(sales):>9,} │ R {value:>10,.0f} │ "
+              f"{int(slow):>5}  │ {int(reorder):>6}  │ {turnover:>6.1f}x  │")
     print("└────────────────┴───────────┴──────────────┴────────┴─────────┴──────────┘")
 
 
-def print_dead_stock_by_category(df: pd.DataFrame):
-    """Print slow-moving stock analysis by category."""
-    slow = df[df["demand_class"] == "Slow-Moving"]
-    cat_stats = slow.groupby("category").agg(
-        count=("sku", "count"),
-        total_value=("stock_value_zar", "sum"),
-        avg_days=("days_of_stock", lambda x: x[x < 9999].mean() if (x < 9999).any() else float("inf")),
-    ).sort_values("total_value", ascending=False)
-
+def print_dead_stock_by_category(cat_stats: pd.DataFrame):
+    """Print slow-moving stock analysis by category (see compute_dead_stock_by_category)."""
     print("\n💀  DEAD STOCK ANALYSIS — Slow-Movers by Category")
     print("─" * 60)
     print(f"{'Category':<16} {'Count':>6} {'Total Value':>14} {'Avg Days Left':>14}")
     print("─" * 60)
-    for cat, row in cat_stats.iterrows():
-        days_str = f"{row['avg_days']:.0f}d" if row["avg_days"] < 9999 else "∞"
-        print(f"{cat:<16} {int(row['count']):>6} R {row['total_value']:>12,.0f} {days_str:>14}")
+    rows = zip(cat_stats.index, *(cat_stats[c].to_numpy() for c in ("count", "total_value", "avg_days")))
+    for cat, count, value, avg_days in rows:
+        days_str = f"{avg_days:.0f}d" if avg_days < 9999 else "∞"
+        print(f"{cat:<16} {int(count):>6} R {value:>12,.0f} {days_str:>14}")
     print("─" * 60)
-    print(f"{'TOTAL':<16} {len(slow):>6} R {slow['stock_value_zar'].sum():>12,.0f}")
+    print(f"{'TOTAL':<16} {int(cat_stats['count'].sum()):>6} R {cat_stats['total_value'].sum():>12,.0f}")
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -330,278 +523,389 @@ def print_dead_stock_by_category(df: pd.DataFrame):
 
 def zar_fmt(x, _): return f"R{x/1000:.0f}k" if x >= 1000 else f"R{x:.0f}"
 
-def create_pdf_report(df: pd.DataFrame, output_path: str):
-    """Generate a multi-page PDF report with all visualizations."""
-
-    month_cols = [f"sales_{m.lower()}" for m in MONTHS]
+def _report_pages(df: pd.DataFrame, monthly: np.ndarray, slow_mask: np.ndarray,
+                  reorder_mask: np.ndarray, branch_stats: pd.DataFrame,
+                  dead_stock: pd.DataFrame) -> list[dict]:
+    """Reduce the dataset to the small per-page inputs the report pages draw from.
+
+    Keeps the payload sent to worker processes to a few arrays/aggregates
+    instead of the full DataFrame.
+    """
+    demand_codes = df["demand_class"].cat.codes.to_numpy()
+
+    # Codes follow DEMAND_CLASSES (Slow → High); the pie reads High → Slow
+    demand_counts = pd.Series(np.bincount(demand_codes, minlength=len(DEMAND_CLASSES))[::-1],
+                              index=DEMAND_CLASSES[::-1])
+    cat_demand = df.groupby(["category", "demand_class"], sort=False, observed=True).size().unstack(fill_value=0)
+    cat_demand = cat_demand.reindex(index=df["category"].cat.categories,
+                                    columns=["High Demand", "Stable", "Slow-Moving"], fill_value=0)
+    cat_demand = cat_demand.loc[cat_demand.sum(axis=1).sort_values(ascending=True).index]
+
+    # (classes, 12) totals in one scatter-add over the rows' demand codes
+    monthly_by_class = np.zeros((len(DEMAND_CLASSES), 12), dtype=monthly.dtype)
+    np.add.at(monthly_by_class, demand_codes, monthly)
+
+    reorder_df = df[reorder_mask].nsmallest(15, "days_of_stock")
+
+    return [
+        {
+            "n_records": len(df),
+            "kpis": [
+                ("Total SKUs", f"{len(df):,}", COLORS["Stable"]),
+                ("Stock Value", f"R {df['stock_value_zar'].sum():,.0f}", "#10b981"),
+                ("Slow-Movers", f"{int(slow_mask.sum())}", COLORS["Slow-Moving"]),
+                ("Need Reorder", f"{int(reorder_mask.sum())}", ACCENT_YELLOW),
+                ("Avg Turnover", f"{df['turnover_ratio'].mean():.1f}x", "#8b5cf6"),
+            ],
+            "demand_counts": demand_counts,
+            "cat_demand": cat_demand,
+        },
+        {
+            "monthly_by_class": monthly_by_class,
+            "demand_codes": demand_codes,
+            "avg_monthly_sales": df["avg_monthly_sales"].to_numpy(),
+            "days_of_stock": df["days_of_stock"].to_numpy(),
+            "stock_value": df["stock_value_zar"].to_numpy(),
+        },
+        {
+            "reorder_labels": [f"{name[:20]} ({branch[:3]})"
+                               for name, branch in reorder_df[["part_name", "branch"]].to_numpy()],
+            "reorder_stocks": reorder_df["current_stock"].to_numpy(),
+            "reorder_points": reorder_df["reorder_point"].to_numpy(),
+            "dead_cat": dead_stock["total_value"],
+        },
+        {
+            "branch_stats": branch_stats,
+        },
+    ]
 
-    with PdfPages(output_path) as pdf:
 
-        # ──────────────── PAGE 1: TITLE + KPIs + PIE ────────────────
-        fig = plt.figure(figsize=(16, 10))
-        fig.suptitle("AUTOMOTIVE INVENTORY & SLOW-MOVER ANALYZER",
-                      fontsize=20, fontweight="bold", color=TEXT_LIGHT, y=0.97)
-        fig.text(0.5, 0.935,
-                 f"40 SKUs · 6 Branches · {len(df)} Records · Mock Dataset",
-                 ha="center", fontsize=11, color=TEXT_DIM)
-
-        # KPI bar across the top
-        kpi_data = [
-            ("Total SKUs", f"{len(df):,}", COLORS["Stable"]),
-            ("Stock Value", f"R {df['stock_value_zar'].sum():,.0f}", "#10b981"),
-            ("Slow-Movers", f"{(df['demand_class'] == 'Slow-Moving').sum()}", COLORS["Slow-Moving"]),
-            ("Need Reorder", f"{int(df['needs_reorder'].sum())}", ACCENT_YELLOW),
-            ("Avg Turnover", f"{df['turnover_ratio'].mean():.1f}x", "#8b5cf6"),
-        ]
-        for i, (label, value, color) in enumerate(kpi_data):
-            ax_kpi = fig.add_axes([0.04 + i * 0.19, 0.81, 0.17, 0.08])
-            ax_kpi.set_xlim(0, 1); ax_kpi.set_ylim(0, 1)
-            ax_kpi.add_patch(plt.Rectangle((0, 0), 1, 1, facecolor=BG_CARD,
-                             edgecolor=BG_GRID, linewidth=1, transform=ax_kpi.transAxes))
-            ax_kpi.text(0.5, 0.65, value, ha="center", va="center",
-                        fontsize=16, fontweight="bold", color=color)
-            ax_kpi.text(0.5, 0.22, label.upper(), ha="center", va="center",
-                        fontsize=8, color=TEXT_DIM, fontweight="bold")
-            ax_kpi.axis("off")
-
-        # Pie chart — demand classification
-        ax_pie = fig.add_axes([0.03, 0.08, 0.38, 0.68])
-        demand_counts = df["demand_class"].value_counts().reindex(["High Demand", "Stable", "Slow-Moving"])
-        wedges, texts, autotexts = ax_pie.pie(
-            demand_counts.values,
-            labels=demand_counts.index,
-            colors=[COLORS[c] for c in demand_counts.index],
-            autopct=lambda p: f"{p:.0f}%\n({int(p * len(df) / 100)})",
-            pctdistance=0.72,
-            wedgeprops=dict(width=0.45, edgecolor=BG_DARK, linewidth=2),
-            textprops=dict(color=TEXT_LIGHT, fontsize=10),
-            startangle=90,
-        )
-        for at in autotexts:
-            at.set_fontsize(8)
-            at.set_color(TEXT_LIGHT)
-        ax_pie.set_title("Demand Classification", fontsize=13, fontweight="bold",
-                          color=TEXT_LIGHT, pad=12)
-
-        # Stacked bar — category breakdown
-        ax_cat = fig.add_axes([0.50, 0.08, 0.46, 0.68])
-        cat_demand = df.groupby(["category", "demand_class"]).size().unstack(fill_value=0)
-        cat_demand = cat_demand.reindex(columns=["High Demand", "Stable", "Slow-Moving"], fill_value=0)
-        cat_demand = cat_demand.loc[cat_demand.sum(axis=1).sort_values(ascending=True).index]
-
-        y_pos = np.arange(len(cat_demand))
-        left = np.zeros(len(cat_demand))
-        for cls in ["High Demand", "Stable", "Slow-Moving"]:
-            vals = cat_demand[cls].values
-            ax_cat.barh(y_pos, vals, left=left, height=0.6,
-                        color=COLORS[cls], edgecolor=BG_DARK, linewidth=0.5, label=cls)
-            for i, (v, l) in enumerate(zip(vals, left)):
-                if v > 0:
-                    ax_cat.text(l + v / 2, i, str(v), ha="center", va="center",
-                                fontsize=8, fontweight="bold", color=TEXT_LIGHT)
-            left += vals
-
-        ax_cat.set_yticks(y_pos)
-        ax_cat.set_yticklabels(cat_demand.index, fontsize=9)
-        ax_cat.set_xlabel("Number of SKU-Branch Records", fontsize=9)
-        ax_cat.set_title("SKU Count by Category & Demand", fontsize=13,
-                          fontweight="bold", color=TEXT_LIGHT, pad=12)
-        ax_cat.legend(loc="lower right", fontsize=8, framealpha=0.8)
-        ax_cat.grid(axis="x", alpha=0.3)
-
-        pdf.savefig(fig, facecolor=BG_DARK)
-        plt.close(fig)
-
-        # ──────────────── PAGE 2: TRENDS + SCATTER ────────────────
-        fig, axes = plt.subplots(2, 1, figsize=(16, 10))
-        fig.suptitle("SALES TRENDS & VELOCITY ANALYSIS", fontsize=16,
-                      fontweight="bold", color=TEXT_LIGHT, y=0.97)
-        plt.subplots_adjust(hspace=0.35, top=0.91, bottom=0.08)
-
-        # Area chart — monthly sales by demand class
-        ax1 = axes[0]
-        for cls in ["High Demand", "Stable", "Slow-Moving"]:
-            subset = df[df["demand_class"] == cls]
-            monthly_totals = subset[month_cols].sum().values
-            ax1.fill_between(range(12), monthly_totals, alpha=0.25, color=COLORS[cls])
-            ax1.plot(range(12), monthly_totals, color=COLORS[cls], linewidth=2.5,
-                     label=cls, marker="o", markersize=4)
-
-        ax1.set_xticks(range(12))
-        ax1.set_xticklabels(MONTHS)
-        ax1.set_ylabel("Total Units Sold")
-        ax1.set_title("12-Month Sales Trend by Demand Category", fontsize=12,
-                       fontweight="bold", color=TEXT_LIGHT, pad=10)
-        ax1.legend(loc="upper right")
-        ax1.grid(alpha=0.3)
-
-        # Scatter — avg monthly sales vs days of stock
-        ax2 = axes[1]
-        for cls in ["High Demand", "Stable", "Slow-Moving"]:
-            subset = df[df["demand_class"] == cls]
-            days = subset["days_of_stock"].clip(upper=400)
-            sizes = (subset["stock_value_zar"] / subset["stock_value_zar"].max() * 200).clip(lower=15)
-            ax2.scatter(subset["avg_monthly_sales"], days, s=sizes,
-                        c=COLORS[cls], alpha=0.55, edgecolors=COLORS[cls],
-                        linewidth=0.5, label=cls)
-
-        ax2.set_xlabel("Average Monthly Sales (units)")
-        ax2.set_ylabel("Days of Stock Remaining")
-        ax2.set_title("Sales Velocity vs Days of Stock  (bubble size = stock value)",
-                       fontsize=12, fontweight="bold", color=TEXT_LIGHT, pad=10)
-        ax2.axhline(y=30, color=ACCENT_YELLOW, linestyle="--", linewidth=1, alpha=0.6, label="30-day threshold")
-        ax2.legend(loc="upper right")
-        ax2.grid(alpha=0.3)
-
-        pdf.savefig(fig, facecolor=BG_DARK)
-        plt.close(fig)
+def _draw_overview_page(fig, page: dict):
+    """PAGE 1: title, KPI cards, demand pie and category stacked bar."""
+    fig.suptitle("AUTOMOTIVE INVENTORY & SLOW-MOVER ANALYZER",
+                  fontsize=20, fontweight="bold", color=TEXT_LIGHT, y=0.97)
+    fig.text(0.5, 0.935,
+             f"40 SKUs · 6 Branches · {page['n_records']} Records · Mock Dataset",
+             fontproperties=REPORT_FONT, ha="center", fontsize=11, color=TEXT_DIM)
+
+    # KPI bar across the top
+    for i, (label, value, color) in enumerate(page["kpis"]):
+        ax_kpi = fig.add_axes([0.04 + i * 0.19, 0.81, 0.17, 0.08])
+        ax_kpi.set_xlim(0, 1); ax_kpi.set_ylim(0, 1)
+        ax_kpi.add_patch(plt.Rectangle((0, 0), 1, 1, facecolor=BG_CARD,
+                         edgecolor=BG_GRID, linewidth=1, transform=ax_kpi.transAxes))
+        ax_kpi.text(0.5, 0.65, value, fontproperties=REPORT_FONT, ha="center", va="center",
+                    fontsize=16, fontweight="bold", color=color)
+        ax_kpi.text(0.5, 0.22, label.upper(), fontproperties=REPORT_FONT, ha="center", va="center",
+                    fontsize=8, color=TEXT_DIM, fontweight="bold")
+        ax_kpi.axis("off")
+
+    # Pie chart — demand classification
+    ax_pie = fig.add_axes([0.03, 0.08, 0.38, 0.68])
+    demand_counts = page["demand_counts"]
+    n_records = page["n_records"]
+    wedges, texts, autotexts = ax_pie.pie(
+        demand_counts.values,
+        labels=demand_counts.index,
+        colors=[COLORS[c] for c in demand_counts.index],
+        autopct=lambda p: f"{p:.0f}%\n({int(p * n_records / 100)})",
+        pctdistance=0.72,
+        wedgeprops=dict(width=0.45, edgecolor=BG_DARK, linewidth=2),
+        textprops=dict(color=TEXT_LIGHT, fontsize=10),
+        startangle=90,
+    )
+    for at in autotexts:
+        at.set_fontsize(8)
+        at.set_color(TEXT_LIGHT)
+    ax_pie.set_title("Demand Classification", fontsize=13, fontweight="bold",
+                      color=TEXT_LIGHT, pad=12)
+
+    # Stacked bar — category breakdown
+    ax_cat = fig.add_axes([0.50, 0.08, 0.46, 0.68])
+    cat_demand = page["cat_demand"]
+
+    y_pos = np.arange(len(cat_demand))
+    left = np.zeros(len(cat_demand))
+    for cls in ["High Demand", "Stable", "Slow-Moving"]:
+        vals = cat_demand[cls].values
+        ax_cat.barh(y_pos, vals, left=left, height=0.6,
+                    color=COLORS[cls], edgecolor=BG_DARK, linewidth=0.5, label=cls)
+        for i, (v, l) in enumerate(zip(vals, left)):
+            if v > 0:
+                ax_cat.text(l + v / 2, i, str(v), fontproperties=REPORT_FONT, ha="center", va="center",
+                            fontsize=8, fontweight="bold", color=TEXT_LIGHT)
+        left += vals
+
+    ax_cat.set_yticks(y_pos)
+    ax_cat.set_yticklabels(cat_demand.index, fontsize=9)
+    ax_cat.set_xlabel("Number of SKU-Branch Records", fontsize=9)
+    ax_cat.set_title("SKU Count by Category & Demand", fontsize=13,
+                      fontweight="bold", color=TEXT_LIGHT, pad=12)
+    ax_cat.legend(loc="lower right", fontsize=8, framealpha=0.8)
+    ax_cat.grid(axis="x", alpha=0.3)
+
+
+def _draw_trends_page(fig, page: dict):
+    """PAGE 2: 12-month trend by demand class and velocity vs days-of-stock scatter."""
+    axes = fig.subplots(2, 1)
+    fig.suptitle("SALES TRENDS & VELOCITY ANALYSIS", fontsize=16,
+                  fontweight="bold", color=TEXT_LIGHT, y=0.97)
+    fig.subplots_adjust(hspace=0.35, top=0.91, bottom=0.08)
+
+    # Area chart — monthly sales by demand class
+    ax1 = axes[0]
+    for cls in ["High Demand", "Stable", "Slow-Moving"]:
+        monthly_totals = page["monthly_by_class"][DEMAND_CLASSES.index(cls)]
+        ax1.fill_between(range(12), monthly_totals, alpha=0.25, color=COLORS[cls])
+        ax1.plot(range(12), monthly_totals, color=COLORS[cls], linewidth=2.5,
+                 label=cls, marker="o", markersize=4)
+
+    ax1.set_xticks(range(12))
+    ax1.set_xticklabels(MONTHS)
+    ax1.set_ylabel("Total Units Sold")
+    ax1.set_title("12-Month Sales Trend by Demand Category", fontsize=12,
+                   fontweight="bold", color=TEXT_LIGHT, pad=10)
+    ax1.legend(loc="upper right")
+    ax1.grid(alpha=0.3)
+
+    # Scatter — avg monthly sales vs days of stock
+    # One rasterized collection for all classes: per-row colours, bubble
+    # sizes scaled to each class's largest stock value, and rows ordered so
+    # Slow-Moving draws on top of Stable on top of High Demand
+    ax2 = axes[1]
+    demand_codes, stock_value = page["demand_codes"], page["stock_value"]
+    class_max = np.zeros(len(DEMAND_CLASSES))
+    np.maximum.at(class_max, demand_codes, stock_value)
+    order = np.argsort(-demand_codes, kind="stable")
+    codes = demand_codes[order]
+    point_colors = np.array([COLORS[c] for c in DEMAND_CLASSES])[codes]
+    sizes = np.clip(stock_value[order] / class_max[codes] * 200, 15, None)
+    ax2.scatter(page["avg_monthly_sales"][order],
+                np.minimum(page["days_of_stock"][order], 400),
+                s=sizes, c=point_colors, alpha=0.55, edgecolors=point_colors,
+                linewidth=0.5, rasterized=True)
+    legend_handles = [
+        Line2D([], [], linestyle="", marker="o", markersize=8, alpha=0.55,
+               color=COLORS[cls], label=cls)
+        for cls in ["High Demand", "Stable", "Slow-Moving"]
+    ]
 
-        # ──────────────── PAGE 3: REORDER ANALYSIS ────────────────
+    ax2.set_xlabel("Average Monthly Sales (units)")
+    ax2.set_ylabel("Days of Stock Remaining")
+    ax2.set_title("Sales Velocity vs Days of Stock  (bubble size = stock value)",
+                   fontsize=12, fontweight="bold", color=TEXT_LIGHT, pad=10)
+    threshold = ax2.axhline(y=30, color=ACCENT_YELLOW, linestyle="--", linewidth=1, alpha=0.6,
+                            label="30-day threshold")
+    ax2.legend(handles=legend_handles + [threshold], loc="upper right")
+    ax2.grid(alpha=0.3)
+
+
+def _draw_reorder_page(fig, page: dict):
+    """PAGE 3: reorder point formula, most urgent reorder items and dead stock by category."""
+    fig.suptitle("REORDER POINT ANALYSIS", fontsize=16,
+                  fontweight="bold", color=TEXT_LIGHT, y=0.97)
+
+    # Formula box
+    ax_formula = fig.add_axes([0.05, 0.85, 0.90, 0.07])
+    ax_formula.set_xlim(0, 1); ax_formula.set_ylim(0, 1)
+    ax_formula.add_patch(plt.Rectangle((0, 0), 1, 1, facecolor="#1a1520",
+                         edgecolor=ACCENT_YELLOW, linewidth=1.5, transform=ax_formula.transAxes))
+    ax_formula.text(0.5, 0.6,
+        "Reorder Point  =  (Daily Sales Rate × Lead Time Days)  +  Safety Stock",
+        ha="center", va="center", fontsize=13, fontweight="bold", color=ACCENT_YELLOW,
+        fontproperties=REPORT_FONT_MONO)
+    ax_formula.text(0.5, 0.18,
+        "Where:  Daily Rate = Avg Monthly / 30   |   Safety Stock = Daily Rate × 7 days",
+        ha="center", va="center", fontsize=9, color=TEXT_DIM, fontproperties=REPORT_FONT_MONO)
+    ax_formula.axis("off")
+
+    # Top 15 most urgent reorder items
+    ax_bar = fig.add_axes([0.06, 0.38, 0.88, 0.42])
+
+    if len(page["reorder_labels"]) > 0:
+        labels = page["reorder_labels"][::-1]
+        stocks = page["reorder_stocks"][::-1]
+        rops = page["reorder_points"][::-1]
+        y_pos = np.arange(len(labels))
+
+        rop_bars = ax_bar.barh(y_pos, rops, height=0.5, color=COLORS["Slow-Moving"], alpha=0.35,
+                               label="Reorder Point", edgecolor=COLORS["Slow-Moving"], linewidth=0.8)
+        stock_bars = ax_bar.barh(y_pos, stocks, height=0.5, color=ACCENT_ORANGE,
+                                 label="Current Stock", edgecolor=ACCENT_ORANGE, linewidth=0.8)
+
+        ax_bar.bar_label(rop_bars, labels=[f"ROP: {r}" for r in rops], padding=3,
+                         fontproperties=REPORT_FONT, fontsize=7, color=COLORS["Slow-Moving"])
+        ax_bar.bar_label(stock_bars, labels=[str(s) for s in stocks], label_type="center",
+                         fontproperties=REPORT_FONT, fontsize=7, fontweight="bold", color=TEXT_LIGHT)
+
+        ax_bar.set_yticks(y_pos)
+        ax_bar.set_yticklabels(labels, fontsize=8)
+        ax_bar.set_xlabel("Units")
+        ax_bar.set_title("Top 15 Most Urgent Reorder Items (stock vs reorder point)",
+                          fontsize=11, fontweight="bold", color=TEXT_LIGHT, pad=10)
+        ax_bar.legend(loc="lower right", fontsize=8)
+        ax_bar.grid(axis="x", alpha=0.3)
+
+    # Dead stock by category
+    ax_dead = fig.add_axes([0.06, 0.06, 0.88, 0.26])
+    dead_cat = page["dead_cat"]
+
+    if len(dead_cat) > 0:
+        bars = ax_dead.bar(range(len(dead_cat)), dead_cat.values, width=0.55,
+                           color=COLORS["Slow-Moving"], edgecolor=BG_DARK, linewidth=1)
+        ax_dead.set_xticks(range(len(dead_cat)))
+        ax_dead.set_xticklabels(dead_cat.index, fontsize=9)
+        ax_dead.yaxis.set_major_formatter(mticker.FuncFormatter(zar_fmt))
+        ax_dead.set_title("Dead Stock Value at Risk — Slow-Movers by Category",
+                           fontsize=11, fontweight="bold", color=TEXT_LIGHT, pad=10)
+        ax_dead.bar_label(bars, labels=[f"R{val:,.0f}" for val in dead_cat.values], padding=3,
+                          fontproperties=REPORT_FONT, fontsize=7, color=TEXT_LIGHT)
+        ax_dead.grid(axis="y", alpha=0.3)
+
+
+def _draw_branch_page(fig, page: dict):
+    """PAGE 4: branch comparison — sales volume, stock value, slow-movers, reorder alerts."""
+    axes = fig.subplots(2, 2)
+    fig.suptitle("BRANCH PERFORMANCE COMPARISON", fontsize=16,
+                  fontweight="bold", color=TEXT_LIGHT, y=0.97)
+    fig.subplots_adjust(hspace=0.4, wspace=0.3, top=0.90, bottom=0.08)
+
+    branch_stats = page["branch_stats"]
+    colors_branch = ["#3b82f6", "#10b981", "#f59e0b", "#8b5cf6", "#ef4444", "#06b6d4"]
+
+    # 12M Sales
+    ax = axes[0, 0]
+    bars = ax.bar(range(len(branch_stats)), branch_stats["total_sales"].values,
+                   color=colors_branch[:len(branch_stats)], width=0.6, edgecolor=BG_DARK)
+    ax.set_xticks(range(len(branch_stats)))
+    ax.set_xticklabels([b[:5] for b in branch_stats.index], fontsize=8, rotation=30)
+    ax.set_title("12-Month Sales Volume", fontsize=11, fontweight="bold", color=TEXT_LIGHT, pad=8)
+    ax.grid(axis="y", alpha=0.3)
+    ax.bar_label(bars, labels=[f"{val:,}" for val in branch_stats["total_sales"]], padding=3,
+                 fontproperties=REPORT_FONT, fontsize=7, color=TEXT_LIGHT)
+
+    # Stock Value
+    ax = axes[0, 1]
+    bars = ax.bar(range(len(branch_stats)), branch_stats["stock_value"].values,
+                   color=colors_branch[:len(branch_stats)], width=0.6, edgecolor=BG_DARK)
+    ax.set_xticks(range(len(branch_stats)))
+    ax.set_xticklabels([b[:5] for b in branch_stats.index], fontsize=8, rotation=30)
+    ax.yaxis.set_major_formatter(mticker.FuncFormatter(zar_fmt))
+    ax.set_title("Current Stock Value (ZAR)", fontsize=11, fontweight="bold", color=TEXT_LIGHT, pad=8)
+    ax.grid(axis="y", alpha=0.3)
+
+    # Slow-movers per branch
+    ax = axes[1, 0]
+    bars = ax.bar(range(len(branch_stats)), branch_stats["slow_movers"].values,
+                   color=[COLORS["Slow-Moving"]] * len(branch_stats), width=0.6,
+                   edgecolor=BG_DARK, alpha=0.85)
+    ax.set_xticks(range(len(branch_stats)))
+    ax.set_xticklabels([b[:5] for b in branch_stats.index], fontsize=8, rotation=30)
+    ax.set_title("Slow-Moving SKUs per Branch", fontsize=11, fontweight="bold",
+                  color=TEXT_LIGHT, pad=8)
+    ax.grid(axis="y", alpha=0.3)
+    ax.bar_label(bars, padding=3, fontproperties=REPORT_FONT, fontsize=9, fontweight="bold",
+                 color=COLORS["Slow-Moving"])
+
+    # Reorder alerts per branch
+    ax = axes[1, 1]
+    bars = ax.bar(range(len(branch_stats)), branch_stats["reorder_alerts"].values,
+                   color=[ACCENT_YELLOW] * len(branch_stats), width=0.6,
+                   edgecolor=BG_DARK, alpha=0.85)
+    ax.set_xticks(range(len(branch_stats)))
+    ax.set_xticklabels([b[:5] for b in branch_stats.index], fontsize=8, rotation=30)
+    ax.set_title("Reorder Alerts per Branch", fontsize=11, fontweight="bold",
+                  color=TEXT_LIGHT, pad=8)
+    ax.grid(axis="y", alpha=0.3)
+    ax.bar_label(bars, padding=3, fontproperties=REPORT_FONT, fontsize=9, fontweight="bold",
+                 color=ACCENT_YELLOW)
+
+
+# (draw function, extra savefig kwargs) for each report page, in page order;
+# dpi only affects rasterized artists (the page-2 scatter), the rest stays vector
+REPORT_PAGES = [
+    (_draw_overview_page, {}),
+    (_draw_trends_page, {"dpi": 150}),
+    (_draw_reorder_page, {}),
+    (_draw_branch_page, {}),
+]
+
+
+def _render_page(job: tuple[int, dict]) -> bytes:
+    """Render one report page on its own figure and return it as a one-page PDF."""
+    index, page = job
+    draw, savefig_kwargs = REPORT_PAGES[index]
+    fig = plt.figure(figsize=(16, 10))
+    draw(fig, page)
+    buf = io.BytesIO()
+    with PdfPages(buf) as pdf:
+        pdf.savefig(fig, facecolor=BG_DARK, **savefig_kwargs)
+    plt.close(fig)
+    return buf.getvalue()
+
+
+def create_pdf_report(df: pd.DataFrame, monthly: np.ndarray, slow_mask: np.ndarray,
+                      reorder_mask: np.ndarray, output_path: str,
+                      branch_stats: pd.DataFrame | None = None,
+                      dead_stock: pd.DataFrame | None = None,
+                      parallel: bool = False):
+    """Generate a multi-page PDF report with all visualizations.
+
+    branch_stats / dead_stock take the results of compute_branch_stats and
+    compute_dead_stock_by_category; they are computed here if not given.
+    By default the pages are drawn in turn on a single figure. parallel=True
+    (with pypdf installed and more than one CPU) renders them in a process
+    pool and merges the result instead. Each spawned worker re-imports this
+    module (~0.7 s) while a page takes only ~0.2 s to draw, so the pool is
+    only worth it for much heavier pages. The merged file also carries each
+    page's own font subsets, so it is larger (~205 KB vs ~122 KB); the
+    document metadata is copied over from the first page.
+    """
+    if branch_stats is None:
+        branch_stats = compute_branch_stats(df)
+    if dead_stock is None:
+        dead_stock = compute_dead_stock_by_category(df, slow_mask)
+
+    pages = _report_pages(df, monthly, slow_mask, reorder_mask, branch_stats, dead_stock)
+
+    workers = min(len(pages), os.cpu_count() or 1)
+
+    pypdf = None
+    if parallel and workers > 1:
+        try:  # optional: merges the per-page PDFs
+            import pypdf
+        except ImportError:
+            pass
+
+    if pypdf is not None:
+        # spawn, not fork: the parent may already be running Polars/numba
+        # thread pools, and forking under them can deadlock
+        with mp.get_context("spawn").Pool(workers) as pool:
+            rendered = pool.map(_render_page, enumerate(pages))
+        writer = pypdf.PdfWriter()
+        for page_pdf in rendered:
+            writer.append(io.BytesIO(page_pdf))
+        writer.add_metadata(pypdf.PdfReader(io.BytesIO(rendered[0])).metadata)
+        writer.write(output_path)
+    else:
+        # One figure is reused for every page and cleared after each save
         fig = plt.figure(figsize=(16, 10))
-        fig.suptitle("REORDER POINT ANALYSIS", fontsize=16,
-                      fontweight="bold", color=TEXT_LIGHT, y=0.97)
-
-        # Formula box
-        ax_formula = fig.add_axes([0.05, 0.85, 0.90, 0.07])
-        ax_formula.set_xlim(0, 1); ax_formula.set_ylim(0, 1)
-        ax_formula.add_patch(plt.Rectangle((0, 0), 1, 1, facecolor="#1a1520",
-                             edgecolor=ACCENT_YELLOW, linewidth=1.5, transform=ax_formula.transAxes))
-        ax_formula.text(0.5, 0.6,
-            "Reorder Point  =  (Daily Sales Rate × Lead Time Days)  +  Safety Stock",
-            ha="center", va="center", fontsize=13, fontweight="bold", color=ACCENT_YELLOW,
-            fontfamily="monospace")
-        ax_formula.text(0.5, 0.18,
-            "Where:  Daily Rate = Avg Monthly / 30   |   Safety Stock = Daily Rate × 7 days",
-            ha="center", va="center", fontsize=9, color=TEXT_DIM, fontfamily="monospace")
-        ax_formula.axis("off")
-
-        # Top 15 most urgent reorder items
-        ax_bar = fig.add_axes([0.06, 0.38, 0.88, 0.42])
-        reorder_df = df[df["needs_reorder"]].nsmallest(15, "days_of_stock")
-
-        if len(reorder_df) > 0:
-            labels = [f"{r['part_name'][:20]} ({r['branch'][:3]})" for _, r in reorder_df.iterrows()]
-            labels.reverse()
-            stocks = reorder_df["current_stock"].values[::-1]
-            rops = reorder_df["reorder_point"].values[::-1]
-            y_pos = np.arange(len(labels))
-
-            ax_bar.barh(y_pos, rops, height=0.5, color=COLORS["Slow-Moving"],
-                        alpha=0.35, label="Reorder Point", edgecolor=COLORS["Slow-Moving"], linewidth=0.8)
-            ax_bar.barh(y_pos, stocks, height=0.5, color=ACCENT_ORANGE,
-                        label="Current Stock", edgecolor=ACCENT_ORANGE, linewidth=0.8)
-
-            for i, (s, r) in enumerate(zip(stocks, rops)):
-                ax_bar.text(r + 1, i, f"ROP: {r}", va="center", fontsize=7, color=COLORS["Slow-Moving"])
-                ax_bar.text(max(s - 2, 1), i, str(s), va="center", ha="right",
-                            fontsize=7, fontweight="bold", color=TEXT_LIGHT)
-
-            ax_bar.set_yticks(y_pos)
-            ax_bar.set_yticklabels(labels, fontsize=8)
-            ax_bar.set_xlabel("Units")
-            ax_bar.set_title("Top 15 Most Urgent Reorder Items (stock vs reorder point)",
-                              fontsize=11, fontweight="bold", color=TEXT_LIGHT, pad=10)
-            ax_bar.legend(loc="lower right", fontsize=8)
-            ax_bar.grid(axis="x", alpha=0.3)
-
-        # Dead stock by category
-        ax_dead = fig.add_axes([0.06, 0.06, 0.88, 0.26])
-        slow = df[df["demand_class"] == "Slow-Moving"]
-        dead_cat = slow.groupby("category")["stock_value_zar"].sum().sort_values(ascending=False)
-
-        if len(dead_cat) > 0:
-            bars = ax_dead.bar(range(len(dead_cat)), dead_cat.values, width=0.55,
-                               color=COLORS["Slow-Moving"], edgecolor=BG_DARK, linewidth=1)
-            ax_dead.set_xticks(range(len(dead_cat)))
-            ax_dead.set_xticklabels(dead_cat.index, fontsize=9)
-            ax_dead.yaxis.set_major_formatter(mticker.FuncFormatter(zar_fmt))
-            ax_dead.set_title("Dead Stock Value at Risk — Slow-Movers by Category",
-                               fontsize=11, fontweight="bold", color=TEXT_LIGHT, pad=10)
-            for bar, val in zip(bars, dead_cat.values):
-                ax_dead.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 500,
-                             f"R{val:,.0f}", ha="center", fontsize=7, color=TEXT_LIGHT)
-            ax_dead.grid(axis="y", alpha=0.3)
-
-        pdf.savefig(fig, facecolor=BG_DARK)
-        plt.close(fig)
-
-        # ──────────────── PAGE 4: BRANCH COMPARISON ────────────────
-        fig, axes = plt.subplots(2, 2, figsize=(16, 10))
-        fig.suptitle("BRANCH PERFORMANCE COMPARISON", fontsize=16,
-                      fontweight="bold", color=TEXT_LIGHT, y=0.97)
-        plt.subplots_adjust(hspace=0.4, wspace=0.3, top=0.90, bottom=0.08)
-
-        branch_stats = df.groupby("branch").agg(
-            total_sales=("total_sold_12m", "sum"),
-            stock_value=("stock_value_zar", "sum"),
-            slow_count=("demand_class", lambda x: (x == "Slow-Moving").sum()),
-            reorder_count=("needs_reorder", "sum"),
-        ).sort_values("total_sales", ascending=False)
-
-        colors_branch = ["#3b82f6", "#10b981", "#f59e0b", "#8b5cf6", "#ef4444", "#06b6d4"]
-
-        # 12M Sales
-        ax = axes[0, 0]
-        bars = ax.bar(range(len(branch_stats)), branch_stats["total_sales"].values,
-                       color=colors_branch[:len(branch_stats)], width=0.6, edgecolor=BG_DARK)
-        ax.set_xticks(range(len(branch_stats)))
-        ax.set_xticklabels([b[:5] for b in branch_stats.index], fontsize=8, rotation=30)
-        ax.set_title("12-Month Sales Volume", fontsize=11, fontweight="bold", color=TEXT_LIGHT, pad=8)
-        ax.grid(axis="y", alpha=0.3)
-        for bar, val in zip(bars, branch_stats["total_sales"]):
-            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 50,
-                     f"{val:,}", ha="center", fontsize=7, color=TEXT_LIGHT)
-
-        # Stock Value
-        ax = axes[0, 1]
-        bars = ax.bar(range(len(branch_stats)), branch_stats["stock_value"].values,
-                       color=colors_branch[:len(branch_stats)], width=0.6, edgecolor=BG_DARK)
-        ax.set_xticks(range(len(branch_stats)))
-        ax.set_xticklabels([b[:5] for b in branch_stats.index], fontsize=8, rotation=30)
-        ax.yaxis.set_major_formatter(mticker.FuncFormatter(zar_fmt))
-        ax.set_title("Current Stock Value (ZAR)", fontsize=11, fontweight="bold", color=TEXT_LIGHT, pad=8)
-        ax.grid(axis="y", alpha=0.3)
-
-        # Slow-movers per branch
-        ax = axes[1, 0]
-        bars = ax.bar(range(len(branch_stats)), branch_stats["slow_count"].values,
-                       color=[COLORS["Slow-Moving"]] * len(branch_stats), width=0.6,
-                       edgecolor=BG_DARK, alpha=0.85)
-        ax.set_xticks(range(len(branch_stats)))
-        ax.set_xticklabels([b[:5] for b in branch_stats.index], fontsize=8, rotation=30)
-        ax.set_title("Slow-Moving SKUs per Branch", fontsize=11, fontweight="bold",
-                      color=TEXT_LIGHT, pad=8)
-        ax.grid(axis="y", alpha=0.3)
-        for bar, val in zip(bars, branch_stats["slow_count"]):
-            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.3,
-                     str(val), ha="center", fontsize=9, fontweight="bold", color=COLORS["Slow-Moving"])
-
-        # Reorder alerts per branch
-        ax = axes[1, 1]
-        bars = ax.bar(range(len(branch_stats)), branch_stats["reorder_count"].values,
-                       color=[ACCENT_YELLOW] * len(branch_stats), width=0.6,
-                       edgecolor=BG_DARK, alpha=0.85)
-        ax.set_xticks(range(len(branch_stats)))
-        ax.set_xticklabels([b[:5] for b in branch_stats.index], fontsize=8, rotation=30)
-        ax.set_title("Reorder Alerts per Branch", fontsize=11, fontweight="bold",
-                      color=TEXT_LIGHT, pad=8)
-        ax.grid(axis="y", alpha=0.3)
-        for bar, val in zip(bars, branch_stats["reorder_count"]):
-            ax.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.3,
-                     str(val), ha="center", fontsize=9, fontweight="bold", color=ACCENT_YELLOW)
-
-        pdf.savefig(fig, facecolor=BG_DARK)
+        with PdfPages(output_path) as pdf:
+            for (draw, savefig_kwargs), page in zip(REPORT_PAGES, pages):
+                draw(fig, page)
+                pdf.savefig(fig, facecolor=BG_DARK, **savefig_kwargs)
+                fig.clf()
         plt.close(fig)
 
     print(f"\n✅  PDF report saved → {output_path}")
 
 
 # ═══════════════════════════════════════════════════════════════
-# 5. EXPORT CSV
+# 5. EXPORT PARQUET / CSV
 # ═══════════════════════════════════════════════════════════════
 
-def export_csv(df: pd.DataFrame, path: str):
-    """Export the full analysed dataset to CSV."""
+def _export_frame(df: pd.DataFrame, monthly: np.ndarray) -> pd.DataFrame:
+    """Full analysed dataset in export column order, with sales_<mon> columns."""
     export_cols = [
         "sku", "part_name", "category", "branch", "unit_cost_zar",
         "avg_monthly_sales", "total_sold_12m", "current_stock",
@@ -609,9 +913,26 @@ def export_csv(df: pd.DataFrame, path: str):
         "daily_sales_rate", "safety_stock_units", "lead_time_demand",
         "reorder_point", "days_of_stock", "needs_reorder",
         "stock_value_zar", "shortfall", "suggested_order", "turnover_ratio",
-    ] + [f"sales_{m.lower()}" for m in MONTHS]
+    ]
+    month_cols = [f"sales_{m.lower()}" for m in MONTHS]
+
+    # Monthly sales are only expanded into columns at write time
+    monthly_df = pd.DataFrame(monthly, columns=month_cols, index=df.index)
+    return pd.concat([df[export_cols], monthly_df], axis=1)
+
+
+def export_parquet(df: pd.DataFrame, monthly: np.ndarray, path: str):
+    """Export the full analysed dataset to ZSTD-compressed Parquet (requires pyarrow).
+
+    Categorical columns are stored dictionary-encoded.
+    """
+    _export_frame(df, monthly).to_parquet(path, engine="pyarrow", compression="zstd", index=False)
+    print(f"✅  Parquet dataset saved → {path}")
+
 
-    df[export_cols].to_csv(path, index=False)
+def export_csv(df: pd.DataFrame, monthly: np.ndarray, path: str):
+    """Export the full analysed dataset to CSV (legacy / BI-tool friendly format)."""
+    _export_frame(df, monthly).to_csv(path, index=False)
     print(f"✅  CSV dataset saved → {path}")
 
 
@@ -622,24 +943,33 @@ def export_csv(df: pd.DataFrame, path: str):
 if __name__ == "__main__":
     # 1. Generate data
     print("Generating mock automotive parts dataset...")
-    df_raw = generate_dataset()
+    df, monthly = generate_dataset()
 
     # 2. Add analytics columns
-    df = add_calculated_columns(df_raw)
+    df = add_calculated_columns(df)
+    slow_mask = df["is_slow"].to_numpy()
+    reorder_mask = df["needs_reorder"].to_numpy()
 
     # 3. Console summaries
-    print_kpi_summary(df)
+    print_kpi_summary(df, slow_mask, reorder_mask)
     print_demand_breakdown(df)
-    print_reorder_alerts(df, top_n=15)
-    print_branch_comparison(df)
-    print_dead_stock_by_category(df)
+    print_reorder_alerts(df, reorder_mask, top_n=15)
+    branch_stats = compute_branch_stats(df)
+    dead_stock = compute_dead_stock_by_category(df, slow_mask)
+    print_branch_comparison(branch_stats)
+    print_dead_stock_by_category(dead_stock)
 
     # 4. Visual PDF report
-    create_pdf_report(df, "inventory_report.pdf")
+    create_pdf_report(df, monthly, slow_mask, reorder_mask, "inventory_report.pdf",
+                      branch_stats=branch_stats, dead_stock=dead_stock)
 
-    # 5. Export CSV
-    export_csv(df, "inventory_dataset.csv")
+    # 5. Export dataset
+    if pyarrow is not None:
+        export_parquet(df, monthly, "inventory_dataset.parquet")
+    export_csv(df, monthly, "inventory_dataset.csv")
 
     print("\n🏁  Done! Files generated:")
-    print("   • inventory_report.pdf  — 4-page visual dashboard")
-    print("   • inventory_dataset.csv — full analysed dataset (240 rows)")
+    print("   • inventory_report.pdf      — 4-page visual dashboard")
+    if pyarrow is not None:
+        print("   • inventory_dataset.parquet — full analysed dataset (240 rows)")
+    print("   • inventory_dataset.csv     — full analysed dataset (240 rows)")